@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# join_intraday_events_fx.py
+"""
+Pair intraday event buckets with intraday FX bars.
+
+Each FX bar is matched (as-of, backward) to the most recent event bucket that
+had already closed when the bar opened, so a bar never sees events published
+after its own start. A bucket is carried forward over at most one missing
+bucket; longer gaps in event coverage stay visible as NaN counts.
+
+Usage:
+    python scripts/join_intraday_events_fx.py --freq 1h
+"""
+import os
+import glob
+import argparse
+import pandas as pd
+
+from update_intraday_events import BUCKET_FREQS, INTRADAY_DIR as EVENTS_INTRADAY_DIR
+from update_intraday_currencies import bars_path
+
+OUTPUT_DIR = "data/processed"
+
+
+# ----------------------------
+# Load data
+# ----------------------------
+def load_event_buckets(freq):
+    print(f"📥 Loading {freq} event buckets...")
+    files = sorted(glob.glob(os.path.join(EVENTS_INTRADAY_DIR, freq, "*", "events_*.parquet")))
+    if not files:
+        raise ValueError(f"No {freq} event buckets found. Did you run update_intraday_events.py?")
+    return pd.concat((pd.read_parquet(f) for f in files), ignore_index=True)
+
+
+def load_fx_bars(freq):
+    print(f"📥 Loading {freq} FX bars...")
+    path = bars_path(freq)
+    if not os.path.exists(path):
+        raise ValueError(f"No {freq} FX bars found. Did you run update_intraday_currencies.py?")
+    return pd.read_parquet(path)
+
+
+# ----------------------------
+# As-of join
+# ----------------------------
+def asof_join(buckets, bars, freq):
+    """Attach to every FX bar the latest event bucket that ended at or before the bar's start."""
+    step = pd.Timedelta(BUCKET_FREQS[freq])
+
+    buckets = buckets.sort_values("BUCKET_START").copy()
+    buckets["BUCKET_START"] = buckets["BUCKET_START"].astype("datetime64[ns, UTC]")
+    buckets["BUCKET_END"] = buckets["BUCKET_START"] + step
+
+    bars = bars.sort_index()
+    pct = (bars.pct_change(fill_method=None).round(5) * 100).add_suffix("_pctchg")
+    fx = pd.concat([bars, pct], axis=1).reset_index()
+    fx["Datetime"] = fx["Datetime"].astype("datetime64[ns, UTC]")
+
+    return pd.merge_asof(
+        fx,
+        buckets,
+        left_on="Datetime",
+        right_on="BUCKET_END",
+        direction="backward",
+        tolerance=step,
+    )
+
+
+# ----------------------------
+# Main
+# ----------------------------
+def main():
+    parser = argparse.ArgumentParser(description="As-of join intraday event buckets with FX bars.")
+    parser.add_argument("--freq", choices=sorted(BUCKET_FREQS), default="1h")
+    args = parser.parse_args()
+
+    merged = asof_join(load_event_buckets(args.freq), load_fx_bars(args.freq), args.freq)
+
+    output_path = os.path.join(OUTPUT_DIR, f"intraday_events_fx_{args.freq}.parquet")
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    merged.to_parquet(output_path, index=False, compression="zstd")
+    print(f"✅ Saved {len(merged)} {args.freq} rows to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# update_intraday_currencies.py
+"""
+Intraday companion to update_historical_currencies.py.
+
+Fetches USD FX closing bars at the same bucket sizes as
+update_intraday_events.py and stores them as one compact parquet file per
+bucket size. Yahoo Finance only serves a limited intraday history (about 60
+days of 15m bars, 730 days of hourly bars) and has no 4h interval, so 4h bars
+are built from hourly ones.
+
+The price source is a plain function, so it can be swapped out: set
+FX_BARS_DIR to a folder of <CUR>.csv files (Datetime, Close columns) to run
+fully offline.
+
+Usage:
+    python scripts/update_intraday_currencies.py --freq 1h
+"""
+import os
+import argparse
+import yfinance as yf
+import pandas as pd
+
+from update_historical_currencies import CURRENCIES, BASE_CURRENCY
+from update_intraday_events import BUCKET_FREQS
+
+# ----------------------------
+# Configuration
+# ----------------------------
+INTRADAY_DIR = "data/currencies/intraday"
+
+# bucket size -> (Yahoo interval to download, max history Yahoo serves for it)
+YAHOO_INTERVALS = {
+    "15m": ("15m", pd.Timedelta(days=59)),
+    "1h": ("60m", pd.Timedelta(days=729)),
+    "4h": ("60m", pd.Timedelta(days=729)),
+}
+
+
+# ----------------------------
+# Providers
+# ----------------------------
+def yahoo_provider(cur, start, end, freq):
+    """Closing prices for USD<cur> from Yahoo Finance."""
+    interval, _ = YAHOO_INTERVALS[freq]
+    ticker = f"{BASE_CURRENCY}{cur}=X"
+    df = yf.download(ticker, start=start, end=end, interval=interval, progress=False)
+    if df.empty:
+        return pd.Series(dtype="float64")
+    return df[["Close"]].iloc[:, 0]
+
+
+def csv_provider(directory):
+    """Provider reading <directory>/<CUR>.csv files, for offline runs and tests."""
+    def provider(cur, start, end, freq):
+        path = os.path.join(directory, f"{cur}.csv")
+        if not os.path.exists(path):
+            return pd.Series(dtype="float64")
+        df = pd.read_csv(path, parse_dates=["Datetime"], index_col="Datetime")
+        return df["Close"]
+    return provider
+
+
+def default_provider():
+    bars_dir = os.environ.get("FX_BARS_DIR")
+    return csv_provider(bars_dir) if bars_dir else yahoo_provider
+
+
+# ----------------------------
+# Helper Functions
+# ----------------------------
+def to_utc(index):
+    index = pd.DatetimeIndex(index)
+    return index.tz_convert("UTC") if index.tz is not None else index.tz_localize("UTC")
+
+
+def fetch_intraday_bars(start, end, freq, provider=yahoo_provider):
+    """Fetch closing bars for all currencies, aligned on the `freq` bucket grid."""
+    step = BUCKET_FREQS[freq]
+    columns = {}
+    for cur in CURRENCIES:
+        try:
+            close = provider(cur, start, end, freq)
+        except Exception as e:
+            print(f"⚠️ Failed to fetch {cur}: {e}")
+            continue
+        if close.empty:
+            continue
+        close.index = to_utc(close.index)
+        close = close[(close.index >= start) & (close.index < end)]
+        # last close inside each bucket; also builds 4h bars out of hourly ones
+        columns[cur] = close.resample(step).last().dropna().astype("float32")
+
+    if not columns:
+        return pd.DataFrame()
+    bars = pd.DataFrame(columns).sort_index()
+    bars.index.name = "Datetime"
+    return bars
+
+
+def bars_path(freq):
+    return os.path.join(INTRADAY_DIR, f"{BASE_CURRENCY}_{freq}.parquet")
+
+
+# ----------------------------
+# Main Incremental Update
+# ----------------------------
+def update(freq, provider=None):
+    provider = provider or default_provider()
+    path = bars_path(freq)
+    end = pd.Timestamp.now(tz="UTC").floor(BUCKET_FREQS[freq])
+    start = end - YAHOO_INTERVALS[freq][1]
+
+    existing = pd.DataFrame()
+    if os.path.exists(path):
+        existing = pd.read_parquet(path)
+        if not existing.empty:
+            # refetch the last stored bar, it may have been still forming
+            start = max(start, existing.index.max())
+            print(f"📈 Last {freq} bar stored: {existing.index.max()}. Fetching from {start}.")
+
+    if start >= end:
+        print(f"✅ {freq} bars already up-to-date. Nothing to fetch.")
+        return
+
+    new_bars = fetch_intraday_bars(start, end, freq, provider=provider)
+    if new_bars.empty:
+        print(f"⚠️ No {freq} bars fetched.")
+        return
+
+    if not existing.empty:
+        combined = pd.concat([existing, new_bars])
+        combined = combined[~combined.index.duplicated(keep="last")].sort_index()
+    else:
+        combined = new_bars
+
+    os.makedirs(INTRADAY_DIR, exist_ok=True)
+    combined.astype("float32").to_parquet(path, compression="zstd")
+    print(f"✅ Intraday bars updated: {path}. Rows: {len(combined)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch intraday USD FX bars.")
+    parser.add_argument("--freq", choices=sorted(BUCKET_FREQS), default="1h")
+    args = parser.parse_args()
+    update(args.freq)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# update_intraday_events.py
+"""
+Intraday companion to update_historical_events.py.
+
+Instead of collapsing every row to SQLDATE, each GDELT export keeps the
+timestamp it was published under (the 15-minute slot in its file name) and
+India events are counted per time bucket (15m, 1h or 4h). Exports are
+streamed one at a time and completed buckets are flushed as soon as a later
+export arrives, so memory stays bounded to the buckets still open and only
+the counts -- never the raw rows -- are written to disk.
+
+Usage:
+    python scripts/update_intraday_events.py --freq 1h --year 2025 --month 8
+"""
+import os
+import gc
+import argparse
+import pandas as pd
+from datetime import datetime
+
+from update_historical_events import fetch_gdelt_index, download_and_extract, is_india_location
+
+# ----------------------------
+# Configuration
+# ----------------------------
+INTRADAY_DIR = "data/events_intraday"
+
+# Supported bucket sizes -> pandas offset aliases
+BUCKET_FREQS = {
+    "15m": "15min",
+    "1h": "1h",
+    "4h": "4h",
+}
+
+
+# ----------------------------
+# Helper Functions
+# ----------------------------
+def export_timestamp(url):
+    """Publication time of an export, taken from its YYYYMMDDHHMMSS file name prefix (UTC)."""
+    fname = url.split("/")[-1]
+    return pd.Timestamp(datetime.strptime(fname[:14], "%Y%m%d%H%M%S"), tz="UTC")
+
+
+def monthly_path(freq, year, month):
+    return os.path.join(INTRADAY_DIR, freq, str(year), f"events_{year}_{month:02d}.parquet")
+
+
+class BucketAggregator:
+    """
+    Running event counts per time bucket.
+
+    Exports must be added in publication order. A bucket is complete once an
+    export published at or after its end has been seen; flush() pops those
+    buckets so only the still-open ones are kept in memory.
+    """
+
+    def __init__(self, freq):
+        self.freq = pd.Timedelta(BUCKET_FREQS[freq])
+        self.open = {}  # bucket start -> [event count, export count]
+
+    def add(self, published, df):
+        start = published.floor(self.freq)
+        counts = self.open.setdefault(start, [0, 0])
+        counts[0] += len(df)
+        counts[1] += 1
+
+    def flush(self, before=None):
+        """Pop buckets that end at or before `before` (all of them when None) as a DataFrame."""
+        ready = sorted(s for s in self.open if before is None or s + self.freq <= before)
+        rows = [(s, *self.open.pop(s)) for s in ready]
+        out = pd.DataFrame(rows, columns=["BUCKET_START", "EVENT_COUNT", "EXPORTS"])
+        out["BUCKET_START"] = pd.to_datetime(out["BUCKET_START"], utc=True)
+        # keep storage compact: counts per bucket never come close to int32 limits
+        return out.astype({"EVENT_COUNT": "int32", "EXPORTS": "int16"})
+
+
+def save_monthly_buckets(df, freq, year, month):
+    path = monthly_path(freq, year, month)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    if os.path.exists(path):
+        existing = pd.read_parquet(path)
+        df = pd.concat([existing, df]).drop_duplicates(subset=["BUCKET_START"], keep="last")
+
+    df = df.sort_values("BUCKET_START").reset_index(drop=True)
+    df.to_parquet(path, index=False, compression="zstd")
+    print(f"💾 Saved {len(df)} {freq} buckets -> {path}")
+
+
+def process_month(files, freq, year, month, fetch=download_and_extract, max_retries=3):
+    """
+    Stream the exports of one month through a BucketAggregator and store the counts.
+
+    `files` is the list of export URLs (see fetch_gdelt_index) and `fetch` turns a
+    URL into the raw export DataFrame; both can be swapped out to run offline.
+    """
+    stamped = ((export_timestamp(f), f) for f in files)
+    month_files = sorted((ts, f) for ts, f in stamped if ts.year == year and ts.month == month)
+    if not month_files:
+        print(f"⚠️ No exports listed for {year}-{month:02d}")
+        return
+
+    # Resume: the last stored bucket may have been partial, so rebuild it
+    path = monthly_path(freq, year, month)
+    resume_from = None
+    if os.path.exists(path):
+        stored = pd.read_parquet(path, columns=["BUCKET_START"])
+        if not stored.empty:
+            resume_from = stored["BUCKET_START"].max()
+            month_files = [(ts, f) for ts, f in month_files if ts >= resume_from]
+            print(f"📈 Resuming {year}-{month:02d} ({freq}) from {resume_from}")
+
+    print(f"\n🔹 Processing {year}-{month:02d} at {freq} resolution ({len(month_files)} exports)")
+    agg = BucketAggregator(freq)
+    flushed = []
+
+    for published, url in month_files:
+        zip_fname = url.split("/")[-1]
+        for attempt in range(max_retries):
+            try:
+                df = fetch(url)
+                df = df[df["ActionGeo_ADM1Code"].apply(is_india_location)]
+                agg.add(published, df)
+                del df
+                break
+            except Exception as e:
+                print(f"⚠️ Attempt {attempt+1} failed for {zip_fname}: {e}")
+                if attempt == max_retries - 1:
+                    print(f"❌ Skipping {zip_fname} after {max_retries} attempts.")
+
+        done = agg.flush(before=published)
+        if not done.empty:
+            flushed.append(done)
+        gc.collect()
+
+    flushed.append(agg.flush())
+    result = pd.concat(flushed, ignore_index=True)
+    if result.empty:
+        print(f"⚠️ No data processed for {year}-{month:02d}")
+        return
+    save_monthly_buckets(result, freq, year, month)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count GDELT India events per intraday time bucket.")
+    parser.add_argument("--freq", choices=sorted(BUCKET_FREQS), default="1h")
+    parser.add_argument("--year", type=int, default=datetime.utcnow().year)
+    parser.add_argument("--month", type=int, nargs="*", help="months to process (default: all of --year)")
+    args = parser.parse_args()
+
+    files = fetch_gdelt_index()
+    months = args.month or range(1, 13)
+    for month in months:
+        process_month(files, args.freq, args.year, month)
+
+
+if __name__ == "__main__":
+    main()